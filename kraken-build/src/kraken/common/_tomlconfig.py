@@ -2,9 +2,10 @@ from collections.abc import Iterator, MutableMapping
 from pathlib import Path
 from typing import Any, Dict
 
-import tomli
 import tomli_w
 
+from kraken.common.toml import tomllib
+
 
 class TomlConfigFile(MutableMapping[str, Any]):
     """
@@ -18,7 +19,7 @@ class TomlConfigFile(MutableMapping[str, Any]):
     def _get_data(self) -> "Dict[str, Any]":
         if self._data is None:
             if self.path.is_file():
-                self._data = tomli.loads(self.path.read_text())
+                self._data = tomllib.loads(self.path.read_text())
             else:
                 self._data = {}
         return self._data
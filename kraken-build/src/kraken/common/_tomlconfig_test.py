@@ -3,10 +3,10 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from textwrap import dedent
 
-import tomli
 from pytest import fixture
 
 from kraken.common._tomlconfig import TomlConfigFile
+from kraken.common.toml import tomllib
 
 
 @fixture
@@ -30,4 +30,4 @@ def test__TomlConfigFile__load_and_save(tempdir: Path) -> None:
     config["foo"] = "bar"
     config.save()
 
-    assert tomli.loads(config_file.read_text()) == {"section": {"key": "value"}, "foo": "bar"}
+    assert tomllib.loads(config_file.read_text()) == {"section": {"key": "value"}, "foo": "bar"}
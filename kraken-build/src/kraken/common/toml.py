@@ -1,9 +1,34 @@
+import copy
+import functools
+import sys
 from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import tomlkit
+from tomlkit import TOMLDocument
+
+# NOTE: This is the one place where we pick the read-only TOML parser, other modules import #tomllib from here. The
+#       `tomli` fallback is only a runtime dependency on Python < 3.11, but it is also a dev dependency so that Mypy
+#       (configured for Python 3.10) can resolve it regardless of the interpreter it runs on.
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+__all__ = ["TomlFile", "tomllib"]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(content: bytes) -> TOMLDocument:
+    """
+    Parses the TOML *content*. The result is cached by the content itself rather than the file's modification time,
+    so a file that is rewritten within the resolution of the filesystem timestamps is never served stale. The
+    returned document is shared and must not be mutated, see #TomlFile.read().
+    """
+
+    return tomlkit.parse(content)
 
 
 @dataclass
@@ -48,8 +73,9 @@ class TomlFile(MutableMapping[str, Any]):
 
     @classmethod
     def read(cls, path: Path) -> "TomlFile":
-        with path.open("rb") as fp:
-            return cls(path, tomlkit.load(fp))
+        # NOTE: Parsing with tomlkit is slow and the same file tends to be read many times across a build, so we
+        #       cache the parsed document and hand out a deep copy that callers are free to mutate.
+        return cls(path, copy.deepcopy(_parse_cached(path.read_bytes())))
 
     def save(self, path: Path | None = None) -> None:
         path = path or self.path
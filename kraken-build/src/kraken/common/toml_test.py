@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from kraken.common.toml import TomlFile
+
+
+def test__TomlFile__read__returns_independent_documents(tmp_path: Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text('[project]\nname = "foo"\nversion = "0.1.0"\n')
+
+    first = TomlFile.read(path)
+    first["project"]["version"] = "0.1.1"
+
+    second = TomlFile.read(path)
+    assert second["project"]["version"] == "0.1.0"
+
+
+def test__TomlFile__read__sees_changes_after_save(tmp_path: Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text('[project]\nname = "foo"\nversion = "0.1.0"\n')
+
+    toml = TomlFile.read(path)
+    toml["project"]["version"] = "0.1.1"
+    toml.save()
+
+    assert TomlFile.read(path)["project"]["version"] == "0.1.1"
+    assert path.read_text() == '[project]\nname = "foo"\nversion = "0.1.1"\n'
@@ -7,9 +7,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import tomli
 import tomli_w
 
+from kraken.common.toml import tomllib
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +24,7 @@ class BuffrsManifest:
     @classmethod
     def read(cls, path: Path) -> BuffrsManifest:
         with path.open("rb") as fp:
-            return cls.of(path, tomli.load(fp))
+            return cls.of(path, tomllib.load(fp))
 
     @classmethod
     def of(cls, path: Path, data: dict[str, Any]) -> BuffrsManifest:
@@ -47,8 +48,7 @@ class BuffrsManifest:
 
     def save(self, path: Path | None = None) -> None:
         path = path or self._path
-        with path.open("wb") as fp:
-            tomli_w.dump(self.to_json(), fp)
+        path.write_bytes(self.to_toml_string().encode())
 
 
 @dataclass
@@ -11,9 +11,10 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import tomli
 import tomli_w
 
+from kraken.common.toml import tomllib
+
 logger = logging.getLogger(__name__)
 
 
@@ -237,7 +238,7 @@ class CargoManifest:
     @classmethod
     def read(cls, path: Path) -> CargoManifest:
         with path.open("rb") as fp:
-            ret = cls.of(path, tomli.load(fp))
+            ret = cls.of(path, tomllib.load(fp))
             if ret.package is None and ret.workspace is None:
                 raise ValueError("Cargo manifest must have either a package or a workspace section.")
             return ret
@@ -275,5 +276,4 @@ class CargoManifest:
 
     def save(self, path: Path | None = None) -> None:
         path = path or self._path
-        with path.open("wb") as fp:
-            tomli_w.dump(self.to_json(), fp)
+        path.write_bytes(self.to_toml_string().encode())
@@ -6,10 +6,10 @@ from collections.abc import Iterator, Sequence
 from pathlib import Path
 from urllib.parse import urlparse
 
-import tomli
 import tomli_w
 
 from kraken.common import atomic_file_swap, not_none
+from kraken.common.toml import tomllib
 from kraken.core import BackgroundTask, Property, TaskStatus
 from kraken.std.cargo.config import CargoRegistry
 from kraken.std.git.config import dump_gitconfig, load_gitconfig
@@ -52,7 +52,7 @@ class CargoAuthProxyTask(BackgroundTask):
         # TODO (@NiklasRosenstein): Can we get away without temporarily modifying the GLOBAL Git config?
 
         cargo_config_toml = self.project.directory / self.cargo_config_file.get()
-        cargo_config = tomli.loads(cargo_config_toml.read_text()) if cargo_config_toml.is_file() else {}
+        cargo_config = tomllib.loads(cargo_config_toml.read_text()) if cargo_config_toml.is_file() else {}
 
         git_config_file = Path("~/.gitconfig").expanduser()
         git_config = load_gitconfig(git_config_file) if git_config_file.is_file() else {}
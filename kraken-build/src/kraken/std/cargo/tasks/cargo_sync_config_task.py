@@ -4,9 +4,9 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import Literal
 
-import tomli
 import tomli_w
 
+from kraken.common.toml import tomllib
 from kraken.core import Project, Property
 from kraken.std.util.render_file_task import RenderFileTask
 
@@ -41,7 +41,7 @@ class CargoSyncConfigTask(RenderFileTask):
         self.content.setcallable(lambda: self.get_file_contents(self.file.get()))
 
     def get_file_contents(self, file: Path) -> str | bytes:
-        content = tomli.loads(file.read_text()) if not self.replace.get() and file.exists() else {}
+        content = tomllib.loads(file.read_text()) if not self.replace.get() and file.exists() else {}
         if self.global_credential_providers.is_set():
             if self.global_credential_providers.get() is None:
                 content.setdefault("registry", {}).pop("global-credential-providers", None)
@@ -145,11 +145,11 @@ class MaturinPoetryPyprojectHandler(PoetryPyprojectHandler):
 
         poetry_section = self._poetry_section
         project_section = self.raw.setdefault("project", {})
+        poetry_get, project_get = poetry_section.get, project_section.get
         for field_name in ("name", "version"):
-            poetry_value = poetry_section.get(field_name)
-            project_value = project_section.get(field_name)
+            poetry_value = poetry_get(field_name)
             if poetry_value is None:
-                poetry_section[field_name] = project_value
+                poetry_section[field_name] = project_get(field_name)
             else:
                 project_section[field_name] = poetry_value
 
@@ -0,0 +1,17 @@
+from kraken.common.toml import TomlFile
+from kraken.std.python.buildsystem.maturin import MaturinPoetryPyprojectHandler
+
+EXAMPLE_MATURIN_POETRY_PYPROJECT = """
+[project]
+name = "maturin-project"
+
+[tool.poetry]
+version = "0.1.0"
+"""
+
+
+def test__MaturinPoetryPyprojectHandler__synchronize_project_section_to_poetry_state() -> None:
+    handler = MaturinPoetryPyprojectHandler(TomlFile.read_string(EXAMPLE_MATURIN_POETRY_PYPROJECT))
+    handler.synchronize_project_section_to_poetry_state()
+    assert handler.raw["tool"]["poetry"]["name"] == "maturin-project"
+    assert handler.raw["project"]["version"] == "0.1.0"
@@ -44,9 +44,10 @@ class PoetryPyprojectHandler(PyprojectHandler):
         assume is returned.
         """
 
-        packages: list[dict[str, Any]] | None = self._poetry_section.get("packages")
+        poetry_section = self._poetry_section
+        packages: list[dict[str, Any]] | None = poetry_section.get("packages")
         if packages is None:
-            package_name = self._poetry_section["name"]
+            package_name = poetry_section["name"]
             return [self.Package(include=package_name.replace("-", "_").replace(".", "_"))]
 
         return [self.Package(include=p["include"], from_=p.get("from")) for p in packages]
@@ -109,17 +110,20 @@ class PoetryPyprojectHandler(PyprojectHandler):
     def set_path_dependencies_to_version(self, version: str) -> None:
         """
         Walks through the `[tool.poetry.dependencies]`, `[tool.poetry.dev-dependencies]`
-        and `[tool.poetry.group.dev.dependencies]` groups to replace all path dependencies
+        and `[tool.poetry.group.<name>.dependencies]` groups to replace all path dependencies
         with proper index dependencies pointing using the specified `version` string.
         """
 
+        poetry_section = self._poetry_section
+
         def _dependency_groups() -> Iterator[tuple[str, dict[str, Any]]]:
-            if dependencies := self._poetry_section.get("dependencies"):
+            if dependencies := poetry_section.get("dependencies"):
                 yield "dependencies", dependencies
-            if dev_dependencies := self._poetry_section.get("dev-dependencies"):
+            if dev_dependencies := poetry_section.get("dev-dependencies"):
                 yield "dev-dependencies", dev_dependencies
-            if group_dev_dependencies := self._poetry_section.get("group", {}).get("dev", {}).get("dependencies"):
-                yield "group.dev.dependencies", group_dev_dependencies
+            for group_name, group in poetry_section.get("group", {}).items():
+                if group_dependencies := group.get("dependencies"):
+                    yield f"group.{group_name}.dependencies", group_dependencies
 
         for name, dependencies in _dependency_groups():
             for key, value in list(dependencies.items()):
@@ -37,6 +37,23 @@ packages = [
 ]
 """
 
+EXAMPLE_POETRY_PYPROJECT_PATH_DEPENDENCIES = """
+[tool.poetry]
+name = "poetry-project"
+version = "0.1.0"
+
+[tool.poetry.dependencies]
+python = "^3.10"
+foo = { path = "../foo", develop = true }
+
+[tool.poetry.group.dev.dependencies]
+bar = { path = "../bar" }
+
+[tool.poetry.group.test.dependencies]
+baz = { path = "../baz" }
+pytest = "^8.0.0"
+"""
+
 
 def test__PoetryPyprojectHandler__getters() -> None:
     handler = PoetryPyprojectHandler(TomlFile.read_string(EXAMPLE_POETRY_PYPROJECT))
@@ -115,3 +132,12 @@ def test__PoetryPyprojectHandler__get_packages_with_includes() -> None:
         PyprojectHandler.Package("kraken/core", from_="src"),
         PyprojectHandler.Package("kraken/std", from_="src"),
     ]
+
+
+def test__PoetryPyprojectHandler__set_path_dependencies_to_version() -> None:
+    handler = PoetryPyprojectHandler(TomlFile.read_string(EXAMPLE_POETRY_PYPROJECT_PATH_DEPENDENCIES))
+    handler.set_path_dependencies_to_version("0.1.1")
+    poetry_section = handler.raw["tool"]["poetry"]
+    assert poetry_section["dependencies"] == {"python": "^3.10", "foo": "0.1.1"}
+    assert poetry_section["group"]["dev"]["dependencies"] == {"bar": "0.1.1"}
+    assert poetry_section["group"]["test"]["dependencies"] == {"baz": "0.1.1", "pytest": "^8.0.0"}
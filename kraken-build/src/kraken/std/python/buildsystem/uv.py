@@ -10,8 +10,9 @@ import logging
 import os
 import shutil
 import subprocess as sp
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import Annotated, Any, Iterable, TypeVar
 
@@ -31,7 +32,7 @@ Safe = Annotated[T, "safe"]
 Unsafe = Annotated[T, "unsafe"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UvIndex:
     # https://docs.astral.sh/uv/configuration/indexes/#defining-an-index
     url: str
@@ -40,66 +41,90 @@ class UvIndex:
     explicit: bool = False
     credentials: tuple[str, str] | None = None
 
+    # Lazily computed values of the #safe_url and #unsafe_url properties. The dataclass is frozen and slotted, so
+    # we can't use #functools.cached_property and assign these with #object.__setattr__() instead.
+    _safe_url: str | None = field(default=None, init=False, repr=False, compare=False)
+    _unsafe_url: str | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def safe_url(self) -> str:
-        if self.credentials:
-            return inject_url_credentials(self.url, self.credentials[0], "[MASKED]")
-        return self.url
+        url = self._safe_url
+        if url is None:
+            url = inject_url_credentials(self.url, self.credentials[0], "[MASKED]") if self.credentials else self.url
+            object.__setattr__(self, "_safe_url", url)
+        return url
 
     @property
     def unsafe_url(self) -> str:
-        if self.credentials:
-            return inject_url_credentials(self.url, self.credentials[0], self.credentials[1])
-        return self.url
+        url = self._unsafe_url
+        if url is None:
+            url = (
+                inject_url_credentials(self.url, self.credentials[0], self.credentials[1])
+                if self.credentials
+                else self.url
+            )
+            object.__setattr__(self, "_unsafe_url", url)
+        return url
 
     @staticmethod
-    def of(index: PackageIndex) -> "UvIndex":
+    def cache_key(index: PackageIndex) -> tuple[Any, ...]:
+        """
+        Returns the values of *index* that #of() is computed from. #of() only reads *index* through this key, so
+        two package indexes with equal keys always map to equal #UvIndex objects.
+        """
+
         credentials = index.credentials if isinstance(index, PythonSettings._PackageIndex) else None
+        return (index.index_url, index.alias, index.priority, credentials)
+
+    @staticmethod
+    def of(index: PackageIndex) -> "UvIndex":
+        index_url, alias, priority, credentials = UvIndex.cache_key(index)
         return UvIndex(
-            index.index_url,
-            name=index.alias if index.alias != "" else None,
-            default=index.priority == index.Priority.default,
-            explicit=index.priority == index.Priority.explicit,
+            index_url,
+            name=alias if alias != "" else None,
+            default=priority == PackageIndex.Priority.default,
+            explicit=priority == PackageIndex.Priority.explicit,
             credentials=credentials,
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UvIndexes:
     indexes: list[UvIndex]
 
     def __post_init__(self) -> None:
-        if len([index for index in self.indexes if index.default]) > 1:
-            raise ValueError("There can be only one default index.")
+        has_default = False
+        for index in self.indexes:
+            if index.default:
+                if has_default:
+                    raise ValueError("There can be only one default index.")
+                has_default = True
 
     @classmethod
     def from_package_indexes(cls, indexes: Iterable[PackageIndex]) -> "UvIndexes":
         indexes = sorted(indexes, key=lambda index: index.priority.level)
         return cls([UvIndex.of(index) for index in indexes])
 
+    def _to_args(self, get_url: Callable[[UvIndex], str]) -> list[str]:
+        return [
+            arg for index in self.indexes for arg in ("--default-index" if index.default else "--index", get_url(index))
+        ]
+
     def to_safe_args(self) -> list[str]:
         """Create a list of arguments for UV with sensitive information masked."""
-        args: list[str] = []
-        for index in self.indexes:
-            args += ["--default-index" if index.default else "--index", index.safe_url]
-        return args
+
+        return self._to_args(attrgetter("safe_url"))
 
     def to_unsafe_args(self) -> list[str]:
         """Create a list of arguments for UV with sensitive information in plaintext."""
 
-        args: list[str] = []
-        for index in self.indexes:
-            args += ["--default-index" if index.default else "--index", index.unsafe_url]
-        return args
+        return self._to_args(attrgetter("unsafe_url"))
 
     def to_config(self) -> list[dict[str, Any]]:
         """Inject UV configuration for indexes into a configuration."""
-        entries: list[dict[str, str | bool]] = []
+        entries: list[dict[str, Any]] = []
         for index in self.indexes:
-            entry: dict[str, Any] = {}
-            if index.name is not None and index.name != "":
-                entry["name"] = index.name
-            entry["url"] = index.url
+            entry: dict[str, Any] = {"name": index.name, "url": index.url} if index.name else {"url": index.url}
             if index.default:
                 entry["default"] = True
             if index.explicit:
@@ -142,8 +167,9 @@ class UvPyprojectHandler(PyprojectHandler):
         [3]: https://docs.astral.sh/uv/reference/settings/#extra-index-url
         """
 
+        uv_config = self.raw.get("tool", {}).get("uv", {})
         indexes: list[PackageIndex] = []
-        for index in self.raw.get("tool", {}).get("uv", {}).get("index", []):
+        for index in uv_config.get("index", []):
             indexes.append(
                 PackageIndex(
                     alias=index.get("name", ""),
@@ -157,7 +183,7 @@ class UvPyprojectHandler(PyprojectHandler):
                 )
             )
 
-        if index_url := self.raw.get("tool", {}).get("uv", {}).get("index-url"):
+        if index_url := uv_config.get("index-url"):
             indexes.append(
                 PackageIndex(
                     alias="",  # unnamed index
@@ -168,7 +194,7 @@ class UvPyprojectHandler(PyprojectHandler):
                 )
             )
 
-        for index_url in self.raw.get("tool", {}).get("uv", {}).get("extra-index-url", []):
+        for index_url in uv_config.get("extra-index-url", []):
             indexes.append(
                 PackageIndex(
                     alias="",  # unnamed index
@@ -181,13 +207,13 @@ class UvPyprojectHandler(PyprojectHandler):
 
     def set_package_indexes(self, indexes: Sequence[PackageIndex]) -> None:
         """Counterpart to [`get_package_indexes()`], check there."""
-        root_config = self.raw.get("tool", {}).get("uv", {})
+        uv_config = self.raw.setdefault("tool", {}).setdefault("uv", {})
 
         # deprecated fields
-        root_config.pop("index-url", None)
-        root_config.pop("extra-index-url", None)
+        uv_config.pop("index-url", None)
+        uv_config.pop("extra-index-url", None)
 
-        config = self.raw.setdefault("tool", {}).setdefault("uv", {}).setdefault("index", [])
+        config = uv_config.setdefault("index", [])
         config.clear()
         config.extend(UvIndexes.from_package_indexes(indexes).to_config())
 
@@ -349,5 +375,5 @@ def _run_with_uv_indexes(command: list[str], settings: PythonSettings, work_dir:
     https://github.com/astral-sh/uv/issues/8810.
     """
     logger.info("Run '%s' in %s.", " ".join(command), work_dir)
-    env_vars = UvIndexes.from_package_indexes(settings.package_indexes.values()).to_env()
+    env_vars = settings.uv_indexes.to_env()
     sp.run(command, cwd=work_dir, env={**os.environ, **env_vars}, check=True)
@@ -3,12 +3,16 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from kraken.core import Project
 from kraken.std.python.pyproject import PackageIndex
 
 from .buildsystem import PythonBuildSystem, detect_build_system
 
+if TYPE_CHECKING:
+    from .buildsystem.uv import UvIndexes
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +47,10 @@ class PythonSettings:
     always_use_managed_env: bool = True
     skip_install_if_venv_exists: bool = True
 
+    #: The cached value of :attr:`uv_indexes`, together with the snapshot of :attr:`package_indexes` it was
+    #: computed from.
+    _uv_indexes: tuple[tuple[Any, ...], UvIndexes] | None = field(default=None, init=False, repr=False, compare=False)
+
     def get_tests_directory(self) -> Path | None:
         """Returns :attr:`tests_directory` if it is set. If not, it will look for the following directories and
         return the first that exists: `test/`, `tests/`, `src/test/`, `src/tests/`. The determined path will be
@@ -62,6 +70,19 @@ class PythonSettings:
         test_dir = self.get_tests_directory()
         return [] if test_dir is None else [str(test_dir)]
 
+    @property
+    def uv_indexes(self) -> UvIndexes:
+        """The :attr:`package_indexes` in the representation used by the UV build system. The value is cached and
+        shared by all UV invocations for the project, and recomputed when :attr:`package_indexes` or any of its
+        entries have changed since."""
+
+        from .buildsystem.uv import UvIndex, UvIndexes
+
+        snapshot = tuple(UvIndex.cache_key(index) for index in self.package_indexes.values())
+        if self._uv_indexes is None or self._uv_indexes[0] != snapshot:
+            self._uv_indexes = (snapshot, UvIndexes.from_package_indexes(self.package_indexes.values()))
+        return self._uv_indexes[1]
+
     def get_default_package_index(self) -> _PackageIndex | None:
         return next(
             (
@@ -31,10 +31,10 @@ class MypyStubtestTask(EnvironmentAwareDispatchTask):
             command.append("--ignore-missing-stub")
         if self.ignore_positional_only.get():
             command.append("--ignore-positional-only")
-        if self.allowlist.is_filled():
-            command.extend(("--allowlist", str(self.allowlist.get().absolute())))
-        if self.mypy_config_file.is_filled():
-            command.extend(("--mypy-config-file", str(self.mypy_config_file.get().absolute())))
+        if allowlist := self.allowlist.get_or(None):
+            command.extend(("--allowlist", str(allowlist.absolute())))
+        if mypy_config_file := self.mypy_config_file.get_or(None):
+            command.extend(("--mypy-config-file", str(mypy_config_file.absolute())))
         return command
 
 
@@ -24,17 +24,16 @@ class RuffTask(EnvironmentAwareDispatchTask):
     additional_args: Property[Sequence[str]] = Property.default_factory(list)
 
     def get_execute_command_v2(self, env: MutableMapping[str, str]) -> list[str] | TaskStatus:
-        command = [
+        config_file = self.config_file.get_or(None)
+        return [
             *self.ruff_cmd.get(),
             *self.ruff_task.get(),
             str(self.settings.source_directory),
             *self.settings.get_tests_directory_as_args(),
+            *map(str, self.settings.lint_enforced_directories),
+            *(("--config", str(config_file.absolute())) if config_file is not None else ()),
+            *self.additional_args.get(),
         ]
-        command += [str(directory) for directory in self.settings.lint_enforced_directories]
-        if self.config_file.is_filled():
-            command += ["--config", str(self.config_file.get().absolute())]
-        command += self.additional_args.get()
-        return command
 
 
 @dataclass
@@ -12,9 +12,8 @@ from unittest.mock import patch
 
 import httpx
 import pytest
-import tomli
 
-from kraken.common.toml import TomlFile
+from kraken.common.toml import TomlFile, tomllib
 from kraken.core import Context, Project
 from kraken.std import python
 from kraken.std.python.buildsystem.maturin import MaturinPoetryPyprojectHandler
@@ -179,7 +178,7 @@ def test__python_project_upgrade_python_version_string(
         assert f'__version__ = "{build_as_version}"' in init_file_ext.read().decode("UTF-8")
         conf_file = tar.extractfile(f"version_project-{build_as_version}/pyproject.toml")
         assert conf_file is not None, ".tar.gz file does not contain an 'pyproject.toml'"
-        assert build_as_version == tomli.loads(conf_file.read().decode("UTF-8"))["tool"]["poetry"]["version"]
+        assert build_as_version == tomllib.loads(conf_file.read().decode("UTF-8"))["tool"]["poetry"]["version"]
 
 
 @unittest.mock.patch.dict(os.environ, {})
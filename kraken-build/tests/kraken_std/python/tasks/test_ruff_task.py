@@ -45,3 +45,13 @@ def test__ruff__fmt_lint_success(kraken_project: Project, script: str) -> None:
 
     # Check that the formatted file corresponds to the expected one
     assert kraken_project.directory.joinpath("src/pyfile.py").read_text() == GOOD_SCRIPT
+
+
+def test__ruff__creates_distinct_tasks(kraken_project: Project) -> None:
+    tasks = ruff()
+    assert [task.name for task in (tasks.check, tasks.fix, tasks.fmt, tasks.fmt_check)] == [
+        "python.ruff.check",
+        "python.ruff.fix",
+        "python.ruff.fmt",
+        "python.ruff.fmt.check",
+    ]
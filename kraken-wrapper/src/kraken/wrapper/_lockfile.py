@@ -25,10 +25,10 @@ class Lockfile:
 
     @staticmethod
     def from_path(path: Path) -> Lockfile:
-        import tomli
+        from kraken.common.toml import tomllib
 
         with path.open("rb") as fp:
-            return Lockfile.from_json(tomli.load(fp))
+            return Lockfile.from_json(tomllib.load(fp))
 
     def write_to(self, path: Path) -> None:
         import tomli_w